@@ -1,3 +1,5 @@
+use std::fmt::Write as _;
+
 use scryer_core::drift::DriftedNode;
 use scryer_core::C4ModelData;
 
@@ -131,12 +133,13 @@ pub fn sync_prompt(
 ) -> String {
     let mut drift_list = String::new();
     for d in drifted {
-        drift_list.push_str(&format!(
-            "- **{}** ({}): changed files matching: {}\n",
+        let _ = writeln!(
+            drift_list,
+            "- **{}** ({}): changed files matching: {}",
             d.node_name,
             d.node_id,
             d.patterns.join(", ")
-        ));
+        );
     }
 
     let structure_section = if structure_changed {
@@ -1,3 +1,4 @@
+use std::borrow::Cow;
 use std::path::PathBuf;
 
 use agent_client_protocol::{
@@ -337,36 +338,69 @@ fn start_cli_session(
     Ok(cancel_tx)
 }
 
+/// The parts of a stream-json event that `summarize_event` reports on.
+/// Everything else is skipped during the single parse rather than buffered.
+#[derive(serde::Deserialize)]
+struct StreamEvent<'a> {
+    #[serde(rename = "type", borrow)]
+    kind: Cow<'a, str>,
+    #[serde(default, borrow)]
+    message: Option<StreamMessage<'a>>,
+    #[serde(default, borrow)]
+    name: Option<Cow<'a, str>>,
+    #[serde(default, borrow)]
+    subtype: Option<Cow<'a, str>>,
+}
+
+#[derive(serde::Deserialize)]
+struct StreamMessage<'a> {
+    #[serde(default, borrow)]
+    content: Vec<ContentBlock<'a>>,
+}
+
+#[derive(serde::Deserialize)]
+struct ContentBlock<'a> {
+    #[serde(rename = "type", default, borrow)]
+    kind: Option<Cow<'a, str>>,
+    #[serde(default, borrow)]
+    name: Option<Cow<'a, str>>,
+    #[serde(default, borrow)]
+    text: Option<Cow<'a, str>>,
+}
+
 /// Extract a readable one-liner from a Claude Code stream-json event.
 fn summarize_event(line: &str) -> Option<String> {
-    let val: serde_json::Value = serde_json::from_str(line).ok()?;
-    let kind = val.get("type")?.as_str()?;
-    match kind {
+    // Deserialize once into borrowed fields; large `user`/`system` payloads are
+    // skipped by the parser instead of being built into a Value.
+    let event: StreamEvent = serde_json::from_str(line).ok()?;
+    match event.kind.as_ref() {
         "assistant" => {
             // Extract text content from assistant message
-            let content = val.pointer("/message/content")?.as_array()?;
-            for block in content {
-                if block.get("type")?.as_str()? == "tool_use" {
-                    let name = block.get("name")?.as_str()?;
-                    return Some(format!("-> {}", name));
-                }
-                if block.get("type")?.as_str()? == "text" {
-                    let text = block.get("text")?.as_str()?;
-                    let first = text.trim().lines().next().unwrap_or("").trim();
-                    if !first.is_empty() {
-                        let truncated = if first.len() > 120 { format!("{}…", &first[..120]) } else { first.to_string() };
-                        return Some(truncated);
+            for block in &event.message?.content {
+                match block.kind.as_deref()? {
+                    "tool_use" => {
+                        let name = block.name.as_deref()?;
+                        return Some(format!("-> {}", name));
+                    }
+                    "text" => {
+                        let text = block.text.as_deref()?;
+                        let first = text.trim().lines().next().unwrap_or("").trim();
+                        if !first.is_empty() {
+                            let truncated = if first.len() > 120 { format!("{}…", &first[..120]) } else { first.to_string() };
+                            return Some(truncated);
+                        }
                     }
+                    _ => {}
                 }
             }
             None
         }
         "tool_result" | "tool_use" => {
-            let name = val.get("name").and_then(|v| v.as_str()).unwrap_or("tool");
+            let name = event.name.as_deref().unwrap_or("tool");
             Some(format!("-> {}", name))
         }
         "result" => {
-            let subtype = val.get("subtype").and_then(|v| v.as_str()).unwrap_or("");
+            let subtype = event.subtype.as_deref().unwrap_or("");
             Some(format!("Done ({})", subtype))
         }
         _ => None,
@@ -1,3 +1,4 @@
+use std::collections::HashMap;
 use std::path::Path;
 use std::time::SystemTime;
 
@@ -33,8 +34,16 @@ pub fn check_drift(
     model_mtime: SystemTime,
     project_path: &Path,
 ) -> DriftReport {
-    let nodes = check_source_drift(model, model_mtime, project_path);
-    let structure_changed = check_structure_drift(model_mtime, project_path);
+    // Both checks are independent filesystem walks; run them side by side.
+    let (nodes, structure_changed) = std::thread::scope(|s| {
+        let structure = s.spawn(|| check_structure_drift(model_mtime, project_path));
+        let nodes = check_source_drift(model, model_mtime, project_path);
+        // Re-raise a panic from the structure walk rather than reporting "unchanged".
+        let structure_changed = structure
+            .join()
+            .unwrap_or_else(|e| std::panic::resume_unwind(e));
+        (nodes, structure_changed)
+    });
     DriftReport { nodes, structure_changed }
 }
 
@@ -45,28 +54,20 @@ fn check_source_drift(
     project_path: &Path,
 ) -> Vec<DriftedNode> {
     let mut drifted = Vec::new();
+    // Several nodes often map to the same pattern (e.g. a shared directory),
+    // so remember each pattern's result instead of re-globbing it.
+    let mut pattern_hits: HashMap<&str, bool> = HashMap::new();
 
     for (node_id, locations) in &model.source_map {
         let mut hit_patterns = Vec::new();
 
         for loc in locations {
             let pat = &loc.pattern;
-            let full_pattern = project_path.join(pat).to_string_lossy().to_string();
-
-            let paths = match glob::glob(&full_pattern) {
-                Ok(paths) => paths,
-                Err(_) => continue,
-            };
-
-            for entry in paths.flatten() {
-                if let Ok(meta) = entry.metadata() {
-                    if let Ok(mtime) = meta.modified() {
-                        if mtime > model_mtime {
-                            hit_patterns.push(pat.clone());
-                            break; // one newer file per pattern is enough
-                        }
-                    }
-                }
+            let hit = *pattern_hits
+                .entry(pat.as_str())
+                .or_insert_with(|| pattern_has_newer_file(project_path, pat, model_mtime));
+            if hit {
+                hit_patterns.push(pat.clone());
             }
         }
 
@@ -89,28 +90,28 @@ fn check_source_drift(
     drifted
 }
 
+/// Whether any file matched by `pattern` (relative to `project_path`) is newer than `since`.
+fn pattern_has_newer_file(project_path: &Path, pattern: &str, since: SystemTime) -> bool {
+    let full_pattern = project_path.join(pattern).to_string_lossy().to_string();
+
+    let paths = match glob::glob(&full_pattern) {
+        Ok(paths) => paths,
+        Err(_) => return false,
+    };
+
+    // one newer file per pattern is enough
+    paths.flatten().any(|entry| {
+        entry
+            .metadata()
+            .and_then(|meta| meta.modified())
+            .is_ok_and(|mtime| mtime > since)
+    })
+}
+
 /// Check if the project structure changed — any file created or deleted since baseline.
 /// Uses the same directory skipping as `get_structure` (SKIP_DIRS, SKIP_BUILD_DIRS, .gitignore).
 fn check_structure_drift(baseline: SystemTime, project_path: &Path) -> bool {
-    use crate::scan::{SKIP_DIRS, SKIP_BUILD_DIRS};
-
-    let walker = ignore::WalkBuilder::new(project_path)
-        .hidden(false)
-        .filter_entry(|entry| {
-            if entry.file_type().is_some_and(|ft| ft.is_dir()) {
-                let name = entry.file_name().to_string_lossy();
-                if SKIP_DIRS.iter().any(|&s| name == s) {
-                    return false;
-                }
-                if SKIP_BUILD_DIRS.iter().any(|&s| name == s) {
-                    return false;
-                }
-            }
-            true
-        })
-        .build();
-
-    for entry in walker.flatten() {
+    for entry in crate::scan::project_walker(project_path).flatten() {
         if entry.file_type().is_some_and(|ft| ft.is_file()) {
             if let Ok(meta) = entry.metadata() {
                 if let Ok(created) = meta.created() {
@@ -507,12 +507,10 @@ pub fn resolve_model_for_project(project_path: &std::path::Path) -> Option<Strin
     let canonical = std::fs::canonicalize(project_path).ok()?;
     let names = list_models().ok()?;
     for name in names {
-        if let Ok(model) = read_model(&name) {
-            if let Some(ref pp) = model.project_path {
-                if let Ok(model_canonical) = std::fs::canonicalize(pp) {
-                    if model_canonical == canonical {
-                        return Some(name);
-                    }
+        if let Some(pp) = read_model_project_path(&name) {
+            if let Ok(model_canonical) = std::fs::canonicalize(&pp) {
+                if model_canonical == canonical {
+                    return Some(name);
                 }
             }
         }
@@ -532,6 +530,21 @@ pub fn read_model(name: &str) -> Result<C4ModelData, String> {
     serde_json::from_str(&raw).map_err(|e| e.to_string())
 }
 
+/// Only the `projectPath` field of a model file; everything else is skipped
+/// without being materialized.
+#[derive(Deserialize)]
+struct ProjectPathOnly {
+    #[serde(rename = "projectPath")]
+    project_path: Option<String>,
+}
+
+/// Read just the `project_path` of a global model, without deserializing its
+/// nodes, edges and flows.
+pub fn read_model_project_path(name: &str) -> Option<String> {
+    let raw = read_model_raw(name).ok()?;
+    serde_json::from_str::<ProjectPathOnly>(&raw).ok()?.project_path
+}
+
 /// Write a model from raw JSON string (for Tauri frontend compatibility).
 ///
 /// Uses atomic write (temp file + rename) so the file watcher sees a single
@@ -675,12 +688,26 @@ pub fn write_model_at(r: &ModelRef, model: &C4ModelData) -> Result<(), String> {
     write_model_raw_at(r, &json)
 }
 
+/// Write a model and refresh its baseline snapshot from one serialization.
+/// Only the model write can fail; a failed baseline write leaves the previous baseline.
+pub fn write_model_and_baseline_at(r: &ModelRef, model: &C4ModelData) -> Result<(), String> {
+    let json = serde_json::to_string_pretty(model).map_err(|e| e.to_string())?;
+    write_model_raw_at(r, &json)?;
+    let _ = fs::write(r.baseline_path(), &json);
+    Ok(())
+}
+
 /// Save a baseline snapshot at a ModelRef location.
 pub fn save_baseline_at(r: &ModelRef, model: &C4ModelData) -> Result<(), String> {
+    let json = serde_json::to_string_pretty(model).map_err(|e| e.to_string())?;
+    save_baseline_raw_at(r, &json)
+}
+
+/// Save a baseline snapshot from raw model JSON (e.g. the file just read).
+pub fn save_baseline_raw_at(r: &ModelRef, data: &str) -> Result<(), String> {
     let dir = r.dir();
     fs::create_dir_all(&dir).map_err(|e| e.to_string())?;
-    let json = serde_json::to_string_pretty(model).map_err(|e| e.to_string())?;
-    fs::write(&r.baseline_path(), json).map_err(|e| e.to_string())
+    fs::write(&r.baseline_path(), data).map_err(|e| e.to_string())
 }
 
 /// Read the baseline snapshot at a ModelRef location.
@@ -736,8 +763,11 @@ fn projects_registry_path() -> PathBuf {
 pub fn register_project(project_path: &Path) -> Result<(), String> {
     let canonical = fs::canonicalize(project_path)
         .map_err(|e| format!("Cannot canonicalize project path: {}", e))?;
-    let mut projects = registered_projects();
+    // Called after every project-local write: the common already-registered case
+    // shouldn't stat every other project, so only prune when the list is rewritten.
+    let mut projects = read_project_registry(&projects_registry_path());
     if !projects.iter().any(|p| p == &canonical) {
+        projects.retain(|p| p.join(".scryer").join("model.scry").exists());
         projects.push(canonical);
         let json = serde_json::to_string_pretty(&projects).map_err(|e| e.to_string())?;
         let dir = models_dir();
@@ -747,21 +777,27 @@ pub fn register_project(project_path: &Path) -> Result<(), String> {
     Ok(())
 }
 
+fn read_project_registry(path: &Path) -> Vec<PathBuf> {
+    fs::read_to_string(path)
+        .ok()
+        .and_then(|raw| serde_json::from_str(&raw).ok())
+        .unwrap_or_default()
+}
+
 /// Read the list of registered project paths, pruning any whose `.scryer/model.scry` no longer exists.
 pub fn registered_projects() -> Vec<PathBuf> {
     let path = projects_registry_path();
-    let raw = match fs::read_to_string(&path) {
-        Ok(s) => s,
-        Err(_) => return vec![],
-    };
-    let all: Vec<PathBuf> = serde_json::from_str(&raw).unwrap_or_default();
+    let all = read_project_registry(&path);
+    let total = all.len();
     let valid: Vec<PathBuf> = all
         .into_iter()
         .filter(|p| p.join(".scryer").join("model.scry").exists())
         .collect();
-    // Lazily prune invalid entries
-    if let Ok(json) = serde_json::to_string_pretty(&valid) {
-        let _ = fs::write(&path, json);
+    // Lazily prune invalid entries — only touch the file if something was dropped
+    if valid.len() != total {
+        if let Ok(json) = serde_json::to_string_pretty(&valid) {
+            let _ = fs::write(&path, json);
+        }
     }
     valid
 }
@@ -773,9 +809,7 @@ pub fn list_all_models() -> Result<Vec<ModelListEntry>, String> {
     // Global models — those with a project_path are project models (not yet migrated),
     // those without are templates.
     for name in list_models()? {
-        let project_path = read_model(&name)
-            .ok()
-            .and_then(|m| m.project_path);
+        let project_path = read_model_project_path(&name);
         let has_project = project_path.is_some();
         entries.push(ModelListEntry {
             ref_str: name.clone(),
@@ -826,12 +860,10 @@ pub fn resolve_model_for_project_ref(project_path: &Path) -> Option<ModelRef> {
     let canonical = fs::canonicalize(project_path).ok()?;
     let names = list_models().ok()?;
     for name in names {
-        if let Ok(model) = read_model(&name) {
-            if let Some(ref pp) = model.project_path {
-                if let Ok(model_canonical) = fs::canonicalize(pp) {
-                    if model_canonical == canonical {
-                        return Some(ModelRef::Global(name));
-                    }
+        if let Some(pp) = read_model_project_path(&name) {
+            if let Ok(model_canonical) = fs::canonicalize(&pp) {
+                if model_canonical == canonical {
+                    return Some(ModelRef::Global(name));
                 }
             }
         }
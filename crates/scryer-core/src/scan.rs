@@ -1,4 +1,5 @@
 use std::collections::BTreeMap;
+use std::fmt::Write as _;
 use std::path::Path;
 
 /// File categories for annotation.
@@ -50,6 +51,29 @@ pub const SKIP_BUILD_DIRS: &[&str] = &[
     "pkg", // wasm-pack
 ];
 
+/// Walk a project the way `get_structure` sees it: dotfiles included (so
+/// `.github`, `.env.example` show up), `.gitignore` honoured, and SKIP_DIRS /
+/// SKIP_BUILD_DIRS pruned. Shared with drift detection so both agree on what
+/// counts as the project.
+pub(crate) fn project_walker(path: &Path) -> ignore::Walk {
+    ignore::WalkBuilder::new(path)
+        .hidden(false)
+        .filter_entry(|entry| {
+            if entry.file_type().is_some_and(|ft| ft.is_dir()) {
+                let name = entry.file_name().to_string_lossy();
+                // Skip noise directories
+                if SKIP_DIRS.iter().any(|&s| name == s) {
+                    return false;
+                }
+                if SKIP_BUILD_DIRS.iter().any(|&s| name == s) {
+                    return false;
+                }
+            }
+            true
+        })
+        .build()
+}
+
 /// Classify a file by its name (not full path).
 fn classify_file(name: &str, rel_path: &Path) -> Option<Category> {
     // Manifests
@@ -210,12 +234,11 @@ impl TreeNode {
             idx += 1;
             let connector = if idx == total_items { "└── " } else { "├── " };
             let padding = 30usize.saturating_sub(name.len());
-            out.push_str(&format!(
-                "{}{}{}{} [{}]\n",
-                prefix, connector, name,
-                " ".repeat(padding),
-                label
-            ));
+            let _ = writeln!(
+                out,
+                "{}{}{}{:padding$} [{}]",
+                prefix, connector, name, "", label
+            );
         }
 
         // Interesting dirs (have annotated descendants) — recurse
@@ -223,7 +246,7 @@ impl TreeNode {
             idx += 1;
             let connector = if idx == total_items { "└── " } else { "├── " };
             let extension = if idx == total_items { "    " } else { "│   " };
-            out.push_str(&format!("{}{}{}/\n", prefix, connector, name));
+            let _ = writeln!(out, "{}{}{}/", prefix, connector, name);
             let child_prefix = format!("{}{}", prefix, extension);
             child.render(out, &child_prefix, depth + 1, max_context_depth);
         }
@@ -233,7 +256,7 @@ impl TreeNode {
             idx += 1;
             let connector = if idx == total_items { "└── " } else { "├── " };
             let extension = if idx == total_items { "    " } else { "│   " };
-            out.push_str(&format!("{}{}{}/\n", prefix, connector, name));
+            let _ = writeln!(out, "{}{}{}/", prefix, connector, name);
             let child_prefix = format!("{}{}", prefix, extension);
             child.render(out, &child_prefix, depth + 1, max_context_depth);
         }
@@ -242,7 +265,7 @@ impl TreeNode {
         if hidden_count > 0 {
             idx += 1;
             let connector = if idx == total_items { "└── " } else { "├── " };
-            out.push_str(&format!("{}{}... ({} more)\n", prefix, connector, hidden_count));
+            let _ = writeln!(out, "{}{}... ({} more)", prefix, connector, hidden_count);
         }
     }
 }
@@ -285,24 +308,7 @@ pub fn project_structure(path: &Path) -> Result<String, String> {
 
     let mut root = TreeNode::new_dir();
 
-    let walker = ignore::WalkBuilder::new(path)
-        .hidden(false) // show dotfiles like .github, .env.example
-        .filter_entry(|entry| {
-            if entry.file_type().is_some_and(|ft| ft.is_dir()) {
-                let name = entry.file_name().to_string_lossy();
-                // Skip noise directories
-                if SKIP_DIRS.iter().any(|&s| name == s) {
-                    return false;
-                }
-                if SKIP_BUILD_DIRS.iter().any(|&s| name == s) {
-                    return false;
-                }
-            }
-            true
-        })
-        .build();
-
-    for entry in walker {
+    for entry in project_walker(path) {
         let entry = match entry {
             Ok(e) => e,
             Err(_) => continue,
@@ -331,10 +337,6 @@ pub fn project_structure(path: &Path) -> Result<String, String> {
             let annotation = classify_file(file_name, rel);
 
             // Ensure parent directories exist
-            if components.len() > 1 {
-                root.ensure_dir(&components[..components.len() - 1]);
-            }
-
             let parent = if components.len() > 1 {
                 root.ensure_dir(&components[..components.len() - 1])
             } else {
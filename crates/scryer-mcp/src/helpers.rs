@@ -48,14 +48,13 @@ fn strip_fields(val: &mut serde_json::Value, compact: bool) {
             if compact {
                 // Strip notes (available via get_node/get_task)
                 map.remove("notes");
-                // Strip empty strings
-                map.retain(|_, v| !matches!(v, serde_json::Value::String(s) if s.is_empty()));
-                // Strip nulls
-                map.retain(|_, v| !v.is_null());
-                // Strip empty arrays
-                map.retain(|_, v| !matches!(v, serde_json::Value::Array(a) if a.is_empty()));
-                // Strip empty objects
-                map.retain(|_, v| !matches!(v, serde_json::Value::Object(m) if m.is_empty()));
+                // Strip empty strings, nulls, empty arrays and empty objects in one pass
+                map.retain(|_, v| {
+                    !matches!(v, serde_json::Value::String(s) if s.is_empty())
+                        && !v.is_null()
+                        && !matches!(v, serde_json::Value::Array(a) if a.is_empty())
+                        && !matches!(v, serde_json::Value::Object(m) if m.is_empty())
+                });
             }
 
             for (_, v) in map.iter_mut() {
@@ -262,17 +261,26 @@ pub(crate) fn format_done_message(model: &C4ModelData) -> String {
     let mut output = String::from("All tasks complete.");
 
     // Check for member nodes (operations/processes/models) that are still proposed
+    // Group proposed members by parent in one pass, then emit per component in model order
+    let mut members_by_parent: HashMap<&str, Vec<&C4Node>> = HashMap::new();
+    for n in &model.nodes {
+        if matches!(n.data.kind, C4Kind::Operation | C4Kind::Process | C4Kind::Model)
+            && matches!(n.data.status, Some(Status::Proposed))
+        {
+            if let Some(pid) = n.parent_id.as_deref() {
+                members_by_parent.entry(pid).or_default().push(n);
+            }
+        }
+    }
     let mut pending_members: Vec<(&C4Node, &str)> = Vec::new();
     for node in &model.nodes {
         if node.data.kind != C4Kind::Component {
             continue;
         }
-        for member in model.nodes.iter().filter(|n| {
-            n.parent_id.as_deref() == Some(&node.id)
-                && matches!(n.data.kind, C4Kind::Operation | C4Kind::Process | C4Kind::Model)
-                && matches!(n.data.status, Some(Status::Proposed))
-        }) {
-            pending_members.push((member, &node.data.name));
+        if let Some(members) = members_by_parent.get(node.id.as_str()) {
+            for &member in members {
+                pending_members.push((member, &node.data.name));
+            }
         }
     }
     if !pending_members.is_empty() {
@@ -1,3 +1,5 @@
+use std::sync::OnceLock;
+
 use crate::instructions::INSTRUCTIONS;
 use rmcp::{
     handler::server::router::tool::ToolRouter,
@@ -30,13 +32,8 @@ impl ScryerServer {
 #[tool_handler]
 impl ServerHandler for ScryerServer {
     fn get_info(&self) -> ServerInfo {
-        let instructions = format!(
-            "{}\n\n## C4 Modeling Rules\n{}",
-            INSTRUCTIONS,
-            scryer_core::rules::RULES
-        );
         ServerInfo {
-            instructions: Some(instructions.into()),
+            instructions: Some(server_instructions().to_owned()),
             capabilities: ServerCapabilities::builder().enable_tools().build(),
             ..Default::default()
         }
@@ -48,9 +45,10 @@ impl ServerHandler for ScryerServer {
         context: RequestContext<RoleServer>,
     ) -> impl std::future::Future<Output = Result<InitializeResult, rmcp::ErrorData>> + Send + '_ {
         // Record which client connected so the Tauri app can use ACP with the same agent
+        // (fire-and-forget: the handshake reply doesn't depend on this file write)
         let client_name = request.client_info.name.clone();
         let client_version = request.client_info.version.clone();
-        write_active_client(&client_name, &client_version);
+        tokio::task::spawn_blocking(move || write_active_client(&client_name, &client_version));
 
         // Default behavior: store peer info and return server info
         if context.peer.peer_info().is_none() {
@@ -60,6 +58,18 @@ impl ServerHandler for ScryerServer {
     }
 }
 
+/// Server instructions plus the C4 rules, assembled once per process.
+fn server_instructions() -> &'static str {
+    static INSTRUCTIONS_WITH_RULES: OnceLock<String> = OnceLock::new();
+    INSTRUCTIONS_WITH_RULES.get_or_init(|| {
+        format!(
+            "{}\n\n## C4 Modeling Rules\n{}",
+            INSTRUCTIONS,
+            scryer_core::rules::RULES
+        )
+    })
+}
+
 /// Write the connected client identity to ~/.scryer/active-client.json
 /// so the Tauri app knows which agent to launch via ACP.
 fn write_active_client(name: &str, version: &str) {
@@ -30,30 +30,29 @@ impl ScryerServer {
             }
         };
 
+        let node_ids: HashSet<&str> = model.nodes.iter().map(|n| n.id.as_str()).collect();
+        let mut edge_ids: HashSet<String> = model.edges.iter().map(|e| e.id.clone()).collect();
         let mut added = Vec::new();
         for item in req.edges {
-            if !model.nodes.iter().any(|n| n.id == item.source) {
+            if !node_ids.contains(item.source.as_str()) {
                 return Ok(CallToolResult::error(vec![Content::text(format!(
                     "Source node '{}' not found",
                     item.source
                 ))]));
             }
-            if !model.nodes.iter().any(|n| n.id == item.target) {
+            if !node_ids.contains(item.target.as_str()) {
                 return Ok(CallToolResult::error(vec![Content::text(format!(
                     "Target node '{}' not found",
                     item.target
                 ))]));
             }
 
-            if item.label.len() > 30 {
-                return Ok(CallToolResult::error(vec![Content::text(format!(
-                    "Edge label '{}' exceeds 30 character limit",
-                    item.label
-                ))]));
+            if let Err(e) = validate_edge_label(&item.label) {
+                return Ok(CallToolResult::error(vec![Content::text(e)]));
             }
 
             let id = scryer_core::make_edge_id(&item.source, &item.target);
-            if model.edges.iter().any(|e| e.id == id) {
+            if !edge_ids.insert(id.clone()) {
                 return Ok(CallToolResult::error(vec![Content::text(format!(
                     "Edge from '{}' to '{}' already exists",
                     item.source, item.target
@@ -76,9 +75,8 @@ impl ScryerServer {
         let bidir_warnings = check_bidirectional_edges(&model);
         let mention_warnings = check_mention_edges(&model);
         let cross_container_warnings = check_cross_container_edges(&model);
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 let mut msg = format!("Added {} edge(s)", added.len());
                 if !cross_level_warnings.is_empty() {
                     msg.push_str(&format!(
@@ -153,11 +151,8 @@ impl ScryerServer {
                 method: None,
             });
             if let Some(label) = item.label {
-                if label.len() > 30 {
-                    return Ok(CallToolResult::error(vec![Content::text(format!(
-                        "Edge label '{}' exceeds 30 character limit",
-                        label
-                    ))]));
+                if let Err(e) = validate_edge_label(&label) {
+                    return Ok(CallToolResult::error(vec![Content::text(e)]));
                 }
                 data.label = label;
             }
@@ -167,9 +162,8 @@ impl ScryerServer {
             updated += 1;
         }
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Updated {} edge(s)",
                     updated
@@ -211,9 +205,8 @@ impl ScryerServer {
             .edges
             .retain(|e| !ids_to_delete.contains(e.id.as_str()));
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Deleted {} edge(s)",
                     req.edge_ids.len()
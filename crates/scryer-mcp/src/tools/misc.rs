@@ -52,9 +52,8 @@ impl ScryerServer {
             }
         }
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Updated source map for {} node(s)",
                     count
@@ -131,9 +130,8 @@ impl ScryerServer {
             }
         }
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 let summary: Vec<String> = flows
                     .iter()
                     .map(|s| format!("'{}' ({} steps)", s.name, s.steps.len()))
@@ -176,9 +174,8 @@ impl ScryerServer {
             ))]));
         }
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Deleted flow '{}'",
                     req.flow_id
@@ -354,9 +351,8 @@ impl ScryerServer {
 
         let count = groups.len();
         let names: Vec<&str> = groups.iter().map(|g| g.name.as_str()).collect();
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Set {} group(s): {}",
                     count,
@@ -416,9 +412,8 @@ impl ScryerServer {
             ))]));
         }
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Deleted group '{}'",
                     req.group_id
@@ -39,47 +39,8 @@ impl ScryerServer {
 
         // Validate nodes
         for node in &model.nodes {
-            if node.data.description.len() > 200
-                && !matches!(
-                    node.data.kind,
-                    C4Kind::Operation | C4Kind::Process | C4Kind::Model
-                )
-            {
-                return Ok(CallToolResult::error(vec![Content::text(format!(
-                    "Description for '{}' must be 200 characters or less",
-                    node.data.name
-                ))]));
-            }
-            if let Some(tech) = &node.data.technology {
-                if tech.len() > 28 {
-                    return Ok(CallToolResult::error(vec![Content::text(format!(
-                        "Technology '{}' on '{}' exceeds 28 character limit",
-                        tech, node.data.name
-                    ))]));
-                }
-            }
-            if node.data.kind == C4Kind::Operation {
-                if let Err(e) = validate_identifier(
-                    &node.data.name,
-                    &format!("{:?} '{}'", node.data.kind, node.id),
-                ) {
-                    return Ok(CallToolResult::error(vec![Content::text(e)]));
-                }
-            }
-            if node.data.kind == C4Kind::Model {
-                if let Err(e) = validate_type_name(
-                    &node.data.name,
-                    &format!("{:?} '{}'", node.data.kind, node.id),
-                ) {
-                    return Ok(CallToolResult::error(vec![Content::text(e)]));
-                }
-            }
-            if !node.data.properties.is_empty() {
-                if let Err(e) =
-                    validate_property_labels(&node.data.properties, &format!("node '{}'", node.id))
-                {
-                    return Ok(CallToolResult::error(vec![Content::text(e)]));
-                }
+            if let Err(e) = validate_node(node) {
+                return Ok(CallToolResult::error(vec![Content::text(e)]));
             }
         }
 
@@ -89,15 +50,8 @@ impl ScryerServer {
         }
 
         // Validate edge labels
-        for edge in &model.edges {
-            if let Some(data) = &edge.data {
-                if data.label.len() > 30 {
-                    return Ok(CallToolResult::error(vec![Content::text(format!(
-                        "Edge label '{}' exceeds 30 character limit",
-                        data.label
-                    ))]));
-                }
-            }
+        if let Err(e) = validate_edge_labels(&model.edges) {
+            return Ok(CallToolResult::error(vec![Content::text(e)]));
         }
 
         // Set project_path to cwd if not already set — needed for source map → editor linking
@@ -124,9 +78,8 @@ impl ScryerServer {
         let bidir_warnings = check_bidirectional_edges(&model);
         let mention_warnings = check_mention_edges(&model);
         let cross_container_warnings = check_cross_container_edges(&model);
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 // Register the project if project-local
                 if let scryer_core::ModelRef::ProjectLocal(ref path) = model_ref {
                     let _ = scryer_core::register_project(path);
@@ -197,20 +150,12 @@ impl ScryerServer {
         for item in &req.nodes {
             let kind = parse_kind(&item.kind)?;
 
-            if item.description.len() > 200
-                && !matches!(kind, C4Kind::Operation | C4Kind::Process | C4Kind::Model)
-            {
-                return Ok(CallToolResult::error(vec![Content::text(format!(
-                    "Description for '{}' must be 200 characters or less",
-                    item.name
-                ))]));
+            if let Err(e) = validate_description(&item.description, &kind, &item.name) {
+                return Ok(CallToolResult::error(vec![Content::text(e)]));
             }
             if let Some(tech) = &item.technology {
-                if tech.len() > 28 {
-                    return Ok(CallToolResult::error(vec![Content::text(format!(
-                        "Technology '{}' on '{}' exceeds 28 character limit",
-                        tech, item.name
-                    ))]));
+                if let Err(e) = validate_technology(tech, &item.name) {
+                    return Ok(CallToolResult::error(vec![Content::text(e)]));
                 }
             }
 
@@ -272,9 +217,8 @@ impl ScryerServer {
             added_ids.push(id);
         }
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Added {} node(s): {}",
                     added_ids.len(),
@@ -334,60 +278,14 @@ impl ScryerServer {
 
         // Validate subtree nodes
         for node in &subtree.nodes {
-            if node.data.description.len() > 200
-                && !matches!(
-                    node.data.kind,
-                    C4Kind::Operation | C4Kind::Process | C4Kind::Model
-                )
-            {
-                return Ok(CallToolResult::error(vec![Content::text(format!(
-                    "Description for '{}' must be 200 characters or less",
-                    node.data.name
-                ))]));
-            }
-            if let Some(tech) = &node.data.technology {
-                if tech.len() > 28 {
-                    return Ok(CallToolResult::error(vec![Content::text(format!(
-                        "Technology '{}' on '{}' exceeds 28 character limit",
-                        tech, node.data.name
-                    ))]));
-                }
-            }
-            if node.data.kind == C4Kind::Operation {
-                if let Err(e) = validate_identifier(
-                    &node.data.name,
-                    &format!("{:?} '{}'", node.data.kind, node.id),
-                ) {
-                    return Ok(CallToolResult::error(vec![Content::text(e)]));
-                }
-            }
-            if node.data.kind == C4Kind::Model {
-                if let Err(e) = validate_type_name(
-                    &node.data.name,
-                    &format!("{:?} '{}'", node.data.kind, node.id),
-                ) {
-                    return Ok(CallToolResult::error(vec![Content::text(e)]));
-                }
-            }
-            if !node.data.properties.is_empty() {
-                if let Err(e) =
-                    validate_property_labels(&node.data.properties, &format!("node '{}'", node.id))
-                {
-                    return Ok(CallToolResult::error(vec![Content::text(e)]));
-                }
+            if let Err(e) = validate_node(node) {
+                return Ok(CallToolResult::error(vec![Content::text(e)]));
             }
         }
 
         // Validate edge labels
-        for edge in &subtree.edges {
-            if let Some(data) = &edge.data {
-                if data.label.len() > 30 {
-                    return Ok(CallToolResult::error(vec![Content::text(format!(
-                        "Edge label '{}' exceeds 30 character limit",
-                        data.label
-                    ))]));
-                }
-            }
+        if let Err(e) = validate_edge_labels(&subtree.edges) {
+            return Ok(CallToolResult::error(vec![Content::text(e)]));
         }
 
         // Collect all existing descendant IDs of node_id
@@ -546,9 +444,8 @@ impl ScryerServer {
             }
         }
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 let mut msg = format!(
                     "Set {} descendant node(s) and {} edge(s) under '{}'",
                     node_count, edge_count, req.node_id
@@ -662,25 +559,14 @@ impl ScryerServer {
                 node.data.name = name;
             }
             if let Some(desc) = item.description {
-                if desc.len() > 200
-                    && !matches!(
-                        node.data.kind,
-                        C4Kind::Operation | C4Kind::Process | C4Kind::Model
-                    )
-                {
-                    return Ok(CallToolResult::error(vec![Content::text(format!(
-                        "Description for '{}' must be 200 characters or less",
-                        item.node_id
-                    ))]));
+                if let Err(e) = validate_description(&desc, &node.data.kind, &item.node_id) {
+                    return Ok(CallToolResult::error(vec![Content::text(e)]));
                 }
                 node.data.description = desc;
             }
             if let Some(tech) = item.technology {
-                if tech.len() > 28 {
-                    return Ok(CallToolResult::error(vec![Content::text(format!(
-                        "Technology '{}' on '{}' exceeds 28 character limit",
-                        tech, item.node_id
-                    ))]));
+                if let Err(e) = validate_technology(&tech, &item.node_id) {
+                    return Ok(CallToolResult::error(vec![Content::text(e)]));
                 }
                 node.data.technology = Some(tech);
             }
@@ -731,9 +617,8 @@ impl ScryerServer {
             updated.push(item.node_id);
         }
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Updated {} node(s)",
                     updated.len()
@@ -788,9 +673,8 @@ impl ScryerServer {
             .retain(|e| !to_delete.contains(&e.source) && !to_delete.contains(&e.target));
         let removed = before - model.nodes.len();
 
-        match scryer_core::write_model_at(&model_ref, &model) {
+        match scryer_core::write_model_and_baseline_at(&model_ref, &model) {
             Ok(()) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 Ok(CallToolResult::success(vec![Content::text(format!(
                     "Deleted {} node(s)",
                     removed
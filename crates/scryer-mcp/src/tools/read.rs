@@ -15,12 +15,16 @@ impl ScryerServer {
     /// Priority: explicit name > session active model > cwd project-local > cwd global match.
     /// Sets the resolved model as the session's active model.
     pub(crate) fn resolve_model(&self, name: Option<String>) -> Result<ModelRef, CallToolResult> {
+        // One lock for the whole lookup: read the session default and record the
+        // result under the same guard, so concurrent calls don't both fall
+        // through to cwd discovery.
+        let mut active = self.active_model.lock().unwrap();
         let model_ref = match name {
             Some(n) => ModelRef::parse(&n),
             None => {
                 // Check session state first
-                if let Some(ref active) = *self.active_model.lock().unwrap() {
-                    return Ok(active.clone());
+                if let Some(ref current) = *active {
+                    return Ok(current.clone());
                 }
                 // Fall back to cwd discovery
                 let cwd = std::env::current_dir().map_err(|_| {
@@ -34,7 +38,7 @@ impl ScryerServer {
             }
         };
         // Remember as active
-        *self.active_model.lock().unwrap() = Some(model_ref.clone());
+        *active = Some(model_ref.clone());
         Ok(model_ref)
     }
 }
@@ -93,9 +97,15 @@ impl ScryerServer {
             Ok(r) => r,
             Err(e) => return Ok(e),
         };
-        match scryer_core::read_model_at(&model_ref) {
+        // Parse the file once and copy its text to the baseline instead of re-serializing.
+        let read = scryer_core::read_model_raw_at(&model_ref).and_then(|raw| {
+            let model: scryer_core::C4ModelData =
+                serde_json::from_str(&raw).map_err(|e| e.to_string())?;
+            let _ = scryer_core::save_baseline_raw_at(&model_ref, &raw);
+            Ok(model)
+        });
+        match read {
             Ok(model) => {
-                let _ = scryer_core::save_baseline_at(&model_ref, &model);
                 let mut val = serde_json::to_value(&model).unwrap();
                 strip_fields_compact(&mut val);
 
@@ -235,7 +245,7 @@ impl ScryerServer {
         externalize_attachments(&mut result, &ref_str);
 
         Ok(CallToolResult::success(vec![Content::text(
-            serde_json::to_string_pretty(&result).unwrap(),
+            serde_json::to_string(&result).unwrap(),
         )]))
     }
 
@@ -8,6 +8,7 @@ use rmcp::{
     tool, tool_router, ErrorData as McpError,
 };
 use scryer_core::{C4Kind, C4Node, Contract, Status};
+use std::collections::HashMap;
 
 #[tool_router(router = tool_router_task, vis = "pub(crate)")]
 impl ScryerServer {
@@ -34,41 +35,37 @@ impl ScryerServer {
 
         let scope_filter: Option<&str> = req.node_id.as_deref();
 
+        // Index nodes by id and by parent once; the helpers below run per candidate node.
+        let node_by_id: HashMap<&str, &C4Node> =
+            model.nodes.iter().map(|n| (n.id.as_str(), n)).collect();
+        let mut children_of: HashMap<&str, Vec<&C4Node>> = HashMap::new();
+        for n in &model.nodes {
+            if let Some(pid) = &n.parent_id {
+                children_of.entry(pid.as_str()).or_default().push(n);
+            }
+        }
+
         // Helper: check if node_id is a descendant of ancestor_id
         let is_descendant_of = |node_id: &str, ancestor_id: &str| -> bool {
-            let mut cur = node_id.to_string();
-            loop {
-                let parent = model
-                    .nodes
-                    .iter()
-                    .find(|n| n.id == cur)
-                    .and_then(|n| n.parent_id.clone());
-                match parent {
-                    Some(pid) if pid == ancestor_id => return true,
-                    Some(pid) => cur = pid,
-                    None => return false,
+            let mut cur = node_id;
+            while let Some(pid) = node_by_id.get(cur).and_then(|n| n.parent_id.as_deref()) {
+                if pid == ancestor_id {
+                    return true;
                 }
+                cur = pid;
             }
+            false
         };
 
         // Helper: get ancestor chain from node up to root (excluding the node itself)
         let get_ancestor_chain = |node_id: &str| -> Vec<&C4Node> {
             let mut chain = Vec::new();
-            let mut cur = node_id.to_string();
-            loop {
-                let parent = model
-                    .nodes
-                    .iter()
-                    .find(|n| n.id == cur)
-                    .and_then(|n| n.parent_id.clone());
-                match parent {
-                    Some(pid) => {
-                        if let Some(pnode) = model.nodes.iter().find(|n| n.id == pid) {
-                            chain.push(pnode);
-                            cur = pid;
-                        } else {
-                            break;
-                        }
+            let mut cur = node_id;
+            while let Some(pid) = node_by_id.get(cur).and_then(|n| n.parent_id.as_deref()) {
+                match node_by_id.get(pid) {
+                    Some(&pnode) => {
+                        chain.push(pnode);
+                        cur = pid;
                     }
                     None => break,
                 }
@@ -107,9 +104,8 @@ impl ScryerServer {
 
         // Helper: check if a node has children with status (task-eligible children)
         let has_status_children = |node: &C4Node| -> bool {
-            model.nodes.iter().any(|n| {
-                n.parent_id.as_deref() == Some(&node.id)
-                    && n.data.status.is_some()
+            children_of.get(node.id.as_str()).into_iter().flatten().any(|n| {
+                n.data.status.is_some()
                     && match node.data.kind {
                         C4Kind::Container => n.data.kind == C4Kind::Component,
                         C4Kind::System => n.data.kind == C4Kind::Container,
@@ -125,12 +121,8 @@ impl ScryerServer {
                 C4Kind::System => C4Kind::Container,
                 _ => return true,
             };
-            model.nodes.iter()
-                .filter(|n| {
-                    n.parent_id.as_deref() == Some(&node.id)
-                        && n.data.kind == child_kind
-                        && n.data.status.is_some()
-                })
+            children_of.get(node.id.as_str()).into_iter().flatten()
+                .filter(|n| n.data.kind == child_kind && n.data.status.is_some())
                 .all(|n| matches!(n.data.status, Some(Status::Implemented) | Some(Status::Verified) | Some(Status::Vagrant)))
         };
 
@@ -163,7 +155,7 @@ impl ScryerServer {
                 }
                 // Skip external systems' children
                 if let Some(pid) = &n.parent_id {
-                    if let Some(parent) = model.nodes.iter().find(|p| p.id == *pid) {
+                    if let Some(parent) = node_by_id.get(pid.as_str()) {
                         if parent.data.external == Some(true) {
                             return false;
                         }
@@ -286,7 +278,7 @@ impl ScryerServer {
             }
             for edge in &model.edges {
                 if edge.source == node.id {
-                    if let Some(target) = model.nodes.iter().find(|n| n.id == edge.target) {
+                    if let Some(target) = node_by_id.get(edge.target.as_str()) {
                         // Only block on sibling components (same parent)
                         if target.data.kind == C4Kind::Component
                             && target.parent_id == node.parent_id
@@ -456,15 +448,14 @@ impl ScryerServer {
                 if node.data.external == Some(true) { continue; }
                 // Skip if parent is external
                 if let Some(pid) = &node.parent_id {
-                    if let Some(parent) = model.nodes.iter().find(|p| p.id == *pid) {
+                    if let Some(parent) = node_by_id.get(pid.as_str()) {
                         if parent.data.external == Some(true) { continue; }
                     }
                 }
                 // Include if the container itself or any of its children need work
                 let self_needs_work = !is_satisfied(node);
-                let children_need_work = model.nodes.iter().any(|n| {
-                    n.parent_id.as_deref() == Some(&node.id)
-                        && n.data.status.is_some()
+                let children_need_work = children_of.get(node.id.as_str()).into_iter().flatten().any(|n| {
+                    n.data.status.is_some()
                         && !matches!(n.data.status, Some(Status::Implemented) | Some(Status::Verified) | Some(Status::Vagrant))
                 });
                 if self_needs_work || children_need_work {
@@ -592,7 +583,7 @@ impl ScryerServer {
             let eligible = matches!(n.data.kind, C4Kind::Container | C4Kind::Component);
             if !eligible || n.data.status.is_none() { return false; }
             if let Some(pid) = &n.parent_id {
-                if let Some(parent) = model.nodes.iter().find(|p| p.id == *pid) {
+                if let Some(parent) = node_by_id.get(pid.as_str()) {
                     if parent.data.external == Some(true) { return false; }
                 }
             }
@@ -603,7 +594,7 @@ impl ScryerServer {
             let eligible = matches!(n.data.kind, C4Kind::Container | C4Kind::Component);
             if !eligible || n.data.status.is_none() { return false; }
             if let Some(pid) = &n.parent_id {
-                if let Some(parent) = model.nodes.iter().find(|p| p.id == *pid) {
+                if let Some(parent) = node_by_id.get(pid.as_str()) {
                     if parent.data.external == Some(true) { return false; }
                 }
             }
@@ -777,7 +768,7 @@ impl ScryerServer {
                 .iter()
                 .filter_map(|e| {
                     if e.source == node.id {
-                        let target = model.nodes.iter().find(|n| n.id == e.target);
+                        let target = node_by_id.get(e.target.as_str());
                         let label = e.data.as_ref().map(|d| d.label.as_str()).unwrap_or("");
                         target.map(|t| {
                             format!(
@@ -788,7 +779,7 @@ impl ScryerServer {
                             )
                         })
                     } else if e.target == node.id {
-                        let source = model.nodes.iter().find(|n| n.id == e.source);
+                        let source = node_by_id.get(e.source.as_str());
                         let label = e.data.as_ref().map(|d| d.label.as_str()).unwrap_or("");
                         source.map(|s| {
                             format!(
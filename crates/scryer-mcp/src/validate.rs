@@ -1,25 +1,26 @@
 use crate::helpers::kind_str;
-use scryer_core::{C4Kind, C4ModelData, C4Node, ModelProperty};
+use scryer_core::{C4Edge, C4Kind, C4ModelData, C4Node, ModelProperty};
 use std::collections::{HashMap, HashSet};
 
 /// Check that a name is a valid identifier: starts with lowercase letter, then [a-zA-Z0-9_]
 fn is_valid_identifier(name: &str) -> bool {
-    let mut chars = name.chars();
-    match chars.next() {
-        Some(c) if c.is_ascii_lowercase() => {}
-        _ => return false,
-    }
-    chars.all(|c| c.is_ascii_alphanumeric() || c == '_')
+    is_ascii_word(name, u8::is_ascii_lowercase)
 }
 
 /// Check that a name is a valid type name: starts with any letter, then [a-zA-Z0-9_]
 fn is_valid_type_name(name: &str) -> bool {
-    let mut chars = name.chars();
-    match chars.next() {
-        Some(c) if c.is_ascii_alphabetic() => {}
-        _ => return false,
+    is_ascii_word(name, u8::is_ascii_alphabetic)
+}
+
+/// Byte-level scan shared by the name checks: `first` gates the leading byte,
+/// the rest must be [a-zA-Z0-9_]. Any non-ASCII byte fails.
+fn is_ascii_word(name: &str, first: fn(&u8) -> bool) -> bool {
+    match name.as_bytes().split_first() {
+        Some((head, rest)) => {
+            first(head) && rest.iter().all(|b| b.is_ascii_alphanumeric() || *b == b'_')
+        }
+        None => false,
     }
-    chars.all(|c| c.is_ascii_alphanumeric() || c == '_')
 }
 
 pub(crate) fn validate_identifier(name: &str, node_label: &str) -> Result<(), String> {
@@ -56,6 +57,66 @@ pub(crate) fn validate_property_labels(properties: &[ModelProperty], node_label:
     Ok(())
 }
 
+/// Descriptions are capped at 200 characters, except on code-level nodes (operation/process/model).
+pub(crate) fn validate_description(description: &str, kind: &C4Kind, node_label: &str) -> Result<(), String> {
+    if description.len() > 200
+        && !matches!(kind, C4Kind::Operation | C4Kind::Process | C4Kind::Model)
+    {
+        Err(format!("Description for '{}' must be 200 characters or less", node_label))
+    } else {
+        Ok(())
+    }
+}
+
+pub(crate) fn validate_technology(technology: &str, node_label: &str) -> Result<(), String> {
+    if technology.len() > 28 {
+        Err(format!(
+            "Technology '{}' on '{}' exceeds 28 character limit",
+            technology, node_label
+        ))
+    } else {
+        Ok(())
+    }
+}
+
+/// Field rules for a complete node payload (set_model, set_node).
+pub(crate) fn validate_node(node: &C4Node) -> Result<(), String> {
+    validate_description(&node.data.description, &node.data.kind, &node.data.name)?;
+    if let Some(tech) = &node.data.technology {
+        validate_technology(tech, &node.data.name)?;
+    }
+    match node.data.kind {
+        C4Kind::Operation => {
+            validate_identifier(&node.data.name, &format!("{:?} '{}'", node.data.kind, node.id))?
+        }
+        C4Kind::Model => {
+            validate_type_name(&node.data.name, &format!("{:?} '{}'", node.data.kind, node.id))?
+        }
+        _ => {}
+    }
+    if !node.data.properties.is_empty() {
+        validate_property_labels(&node.data.properties, &format!("node '{}'", node.id))?;
+    }
+    Ok(())
+}
+
+pub(crate) fn validate_edge_label(label: &str) -> Result<(), String> {
+    if label.len() > 30 {
+        Err(format!("Edge label '{}' exceeds 30 character limit", label))
+    } else {
+        Ok(())
+    }
+}
+
+pub(crate) fn validate_edge_labels(edges: &[C4Edge]) -> Result<(), String> {
+    for edge in edges {
+        if let Some(data) = &edge.data {
+            validate_edge_label(&data.label)?;
+        }
+    }
+    Ok(())
+}
+
 /// Check that no node is parented under an external system.
 pub(crate) fn validate_no_children_of_external(nodes: &[C4Node]) -> Result<(), String> {
     let external_ids: HashSet<&str> = nodes
@@ -81,6 +142,13 @@ pub(crate) fn validate_no_children_of_external(nodes: &[C4Node]) -> Result<(), S
 pub(crate) fn check_disconnected_nodes(model: &C4ModelData) -> Vec<String> {
     let mut warnings: Vec<String> = Vec::new();
 
+    let node_map: HashMap<&str, &C4Node> = model.nodes.iter().map(|n| (n.id.as_str(), n)).collect();
+    let with_edges: HashSet<&str> = model
+        .edges
+        .iter()
+        .flat_map(|e| [e.source.as_str(), e.target.as_str()])
+        .collect();
+
     let check_level = |
         owned_ids: &HashSet<&str>,
         ref_ids: &HashSet<&str>,
@@ -104,9 +172,8 @@ pub(crate) fn check_disconnected_nodes(model: &C4ModelData) -> Vec<String> {
             if connected.contains(oid) {
                 continue;
             }
-            let node = model.nodes.iter().find(|n| n.id == *oid).unwrap();
-            let has_any_edge = model.edges.iter().any(|e| e.source == *oid || e.target == *oid);
-            if has_any_edge {
+            let node = node_map[oid];
+            if with_edges.contains(oid) {
                 warnings.push(format!(
                     "'{}' ({}) has edges but none at this level — \
                     it will appear disconnected in the {}",
@@ -124,7 +191,7 @@ pub(crate) fn check_disconnected_nodes(model: &C4ModelData) -> Vec<String> {
             if connected.contains(rid) {
                 continue;
             }
-            let node = model.nodes.iter().find(|n| n.id == *rid).unwrap();
+            let node = node_map[rid];
             if let Some(pname) = parent_name {
                 warnings.push(format!(
                     "'{}' ({}) has edges to '{}' but not to any of its children — \
@@ -170,7 +237,7 @@ pub(crate) fn check_disconnected_nodes(model: &C4ModelData) -> Vec<String> {
         let ref_ids: HashSet<&str> = system_level_ids
             .iter()
             .filter(|id| {
-                let node = model.nodes.iter().find(|n| n.id == **id).unwrap();
+                let node = node_map[*id];
                 (node.data.kind == C4Kind::Person
                     || (node.data.kind == C4Kind::System && node.id != system.id))
                     && model.edges.iter().any(|e| {
@@ -220,8 +287,7 @@ pub(crate) fn check_disconnected_nodes(model: &C4ModelData) -> Vec<String> {
                 }
             })
             .filter(|id| {
-                let node = model.nodes.iter().find(|n| n.id == *id);
-                match node {
+                match node_map.get(id) {
                     Some(n) => {
                         if Some(*id) == container.parent_id.as_deref() { return false; }
                         if n.data.kind == C4Kind::Component { return false; }
@@ -245,11 +311,11 @@ pub(crate) fn check_bidirectional_edges(model: &C4ModelData) -> Vec<String> {
     let mut seen = HashSet::new();
     for edge in &model.edges {
         let pair = if edge.source < edge.target {
-            (edge.source.clone(), edge.target.clone())
+            (edge.source.as_str(), edge.target.as_str())
         } else {
-            (edge.target.clone(), edge.source.clone())
+            (edge.target.as_str(), edge.source.as_str())
         };
-        if !seen.insert(pair.clone()) {
+        if !seen.insert(pair) {
             let labels: Vec<&str> = model.edges.iter()
                 .filter(|e| {
                     (e.source == pair.0 && e.target == pair.1)
@@ -257,8 +323,8 @@ pub(crate) fn check_bidirectional_edges(model: &C4ModelData) -> Vec<String> {
                 })
                 .filter_map(|e| e.data.as_ref().map(|d| d.label.as_str()))
                 .collect();
-            let src_name = model.nodes.iter().find(|n| n.id == pair.0).map(|n| n.data.name.as_str()).unwrap_or(&pair.0);
-            let tgt_name = model.nodes.iter().find(|n| n.id == pair.1).map(|n| n.data.name.as_str()).unwrap_or(&pair.1);
+            let src_name = model.nodes.iter().find(|n| n.id == pair.0).map(|n| n.data.name.as_str()).unwrap_or(pair.0);
+            let tgt_name = model.nodes.iter().find(|n| n.id == pair.1).map(|n| n.data.name.as_str()).unwrap_or(pair.1);
             warnings.push(format!(
                 "'{}' ↔ '{}' has edges in both directions ({}). \
                 C4 rule 1: one edge per relationship. Are these genuinely independent relationships, \
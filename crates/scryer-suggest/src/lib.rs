@@ -25,12 +25,17 @@ pub async fn get_hints(
     model: &scryer_core::C4ModelData,
     settings: &scryer_core::AiSettings,
 ) -> Vec<Hint> {
+    // Nothing to analyze on an empty canvas; skip the round-trip.
+    if model.nodes.is_empty() {
+        return vec![];
+    }
+
     let system = prompt::system_prompt();
     let user_msg = prompt::user_message(model);
 
     eprintln!("[scryer-suggest] sending to {} ({})", settings.provider, settings.model);
 
-    match engine::generate(settings, &system, &user_msg).await {
+    match engine::generate(settings, system, &user_msg).await {
         Ok(raw) => {
             eprintln!("[scryer-suggest] raw LLM output:\n{}", raw);
             let hints = parse::parse_llm_output(&raw, model);
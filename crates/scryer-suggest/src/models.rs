@@ -1,19 +1,28 @@
+use std::sync::OnceLock;
+
 use reqwest::Client;
 use serde::Deserialize;
 
+/// Shared HTTP client so repeated model-list fetches reuse its connection pool
+/// and TLS sessions instead of building a fresh client each time.
+fn http_client() -> &'static Client {
+    static CLIENT: OnceLock<Client> = OnceLock::new();
+    CLIENT.get_or_init(Client::new)
+}
+
 /// Fetch available chat/text model IDs from a provider's API.
 /// Returns a sorted list filtered to models suitable for text generation.
 pub async fn fetch_models(provider: &str, api_key: &str) -> Result<Vec<String>, String> {
-    let client = Client::new();
+    let client = http_client();
 
     match provider {
-        "ollama" => fetch_ollama(&client).await,
-        "openai" => fetch_openai(&client, api_key).await,
-        "groq" => fetch_openai_compat(&client, "https://api.groq.com/openai/v1/models", api_key).await,
-        "deepseek" => fetch_openai_compat(&client, "https://api.deepseek.com/models", api_key).await,
-        "mistral" => fetch_openai_compat(&client, "https://api.mistral.ai/v1/models", api_key).await,
-        "anthropic" => fetch_anthropic(&client, api_key).await,
-        "google" => fetch_google(&client, api_key).await,
+        "ollama" => fetch_ollama(client).await,
+        "openai" => fetch_openai(client, api_key).await,
+        "groq" => fetch_openai_compat(client, "https://api.groq.com/openai/v1/models", api_key).await,
+        "deepseek" => fetch_openai_compat(client, "https://api.deepseek.com/models", api_key).await,
+        "mistral" => fetch_openai_compat(client, "https://api.mistral.ai/v1/models", api_key).await,
+        "anthropic" => fetch_anthropic(client, api_key).await,
+        "google" => fetch_google(client, api_key).await,
         other => Err(format!("unknown provider: {other}")),
     }
 }
@@ -1,4 +1,6 @@
-use scryer_core::C4ModelData;
+use std::collections::HashSet;
+
+use scryer_core::{C4ModelData, C4Node};
 
 use crate::{Hint, HintSeverity};
 
@@ -19,18 +21,19 @@ pub fn parse_llm_output(raw: &str, model: &C4ModelData) -> Vec<Hint> {
     };
 
     // Try full array parse first
-    let llm_hints: Vec<LlmHint> = match serde_json::from_str(&json_str) {
+    let llm_hints: Vec<LlmHint> = match serde_json::from_str(json_str) {
         Ok(h) => h,
         Err(_) => {
             // Fall back to line-by-line extraction
-            parse_line_by_line(&json_str)
+            parse_line_by_line(json_str)
         }
     };
 
+    let lookup = NodeLookup::new(model);
     llm_hints
         .into_iter()
         .filter_map(|lh| {
-            let node_id = resolve_node_id(&lh.node, model)?;
+            let node_id = lookup.resolve(&lh.node)?;
             Some(Hint {
                 node_id,
                 message: lh.msg,
@@ -41,13 +44,13 @@ pub fn parse_llm_output(raw: &str, model: &C4ModelData) -> Vec<Hint> {
 }
 
 /// Extract the JSON array substring from raw LLM output.
-fn extract_json_array(raw: &str) -> Option<String> {
+fn extract_json_array(raw: &str) -> Option<&str> {
     let start = raw.find('[')?;
     let end = raw.rfind(']')?;
     if end <= start {
         return None;
     }
-    Some(raw[start..=end].to_string())
+    Some(&raw[start..=end])
 }
 
 /// Try to parse individual objects from a malformed JSON array.
@@ -90,46 +93,59 @@ fn parse_line_by_line(json_str: &str) -> Vec<LlmHint> {
     hints
 }
 
-/// Match a node or step identifier from LLM output to an ID in the model.
-/// Tries ID match first (e.g. "node-3", "step-1"), then falls back to name matching.
-fn resolve_node_id(name: &str, model: &C4ModelData) -> Option<String> {
-    // Direct node ID match
-    if model.nodes.iter().any(|n| n.id == name) {
-        return Some(name.to_string());
+/// Ids and lowercased names, built once per parse rather than once per hint.
+struct NodeLookup<'a> {
+    ids: HashSet<&'a str>,
+    nodes: Vec<(&'a C4Node, String)>,
+}
+
+impl<'a> NodeLookup<'a> {
+    fn new(model: &'a C4ModelData) -> Self {
+        let ids = model
+            .nodes
+            .iter()
+            .map(|n| n.id.as_str())
+            .chain(model.flows.iter().flat_map(|f| f.steps.iter().map(|s| s.id.as_str())))
+            .collect();
+        let nodes = model
+            .nodes
+            .iter()
+            .map(|n| (n, n.data.name.to_lowercase()))
+            .collect();
+        Self { ids, nodes }
     }
 
-    // Direct step ID match
-    for flow in &model.flows {
-        if flow.steps.iter().any(|s| s.id == name) {
+    /// Match a node or step identifier from LLM output to an ID in the model.
+    /// Tries ID match first (e.g. "node-3", "step-1"), then falls back to name matching.
+    fn resolve(&self, name: &str) -> Option<String> {
+        // Direct node or step ID match
+        if self.ids.contains(name) {
             return Some(name.to_string());
         }
-    }
 
-    let name_lower = name.to_lowercase();
+        let name_lower = name.to_lowercase();
 
-    // Exact name match
-    if let Some(n) = model.nodes.iter().find(|n| n.data.name == name) {
-        return Some(n.id.clone());
-    }
+        // Exact name match
+        if let Some((n, _)) = self.nodes.iter().find(|(n, _)| n.data.name == name) {
+            return Some(n.id.clone());
+        }
 
-    // Case-insensitive name match
-    if let Some(n) = model
-        .nodes
-        .iter()
-        .find(|n| n.data.name.to_lowercase() == name_lower)
-    {
-        return Some(n.id.clone());
-    }
+        // Case-insensitive name match
+        if let Some((n, _)) = self.nodes.iter().find(|(_, lower)| *lower == name_lower) {
+            return Some(n.id.clone());
+        }
 
-    // Substring match (name contains the LLM's string or vice versa)
-    if let Some(n) = model.nodes.iter().find(|n| {
-        let n_lower = n.data.name.to_lowercase();
-        n_lower.contains(&name_lower) || name_lower.contains(&n_lower)
-    }) {
-        return Some(n.id.clone());
-    }
+        // Substring match (name contains the LLM's string or vice versa)
+        if let Some((n, _)) = self
+            .nodes
+            .iter()
+            .find(|(_, lower)| lower.contains(&name_lower) || name_lower.contains(lower.as_str()))
+        {
+            return Some(n.id.clone());
+        }
 
-    None
+        None
+    }
 }
 
 fn map_severity(s: Option<&str>) -> HintSeverity {
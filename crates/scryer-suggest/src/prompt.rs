@@ -1,17 +1,21 @@
+use std::collections::HashMap;
+use std::sync::OnceLock;
+
 use scryer_core::{C4Kind, C4ModelData, Flow, Status};
 
-fn name_of<'a>(id: &'a str, model: &'a C4ModelData) -> &'a str {
-    model
-        .nodes
-        .iter()
-        .find(|n| n.id == id)
-        .map(|n| n.data.name.as_str())
-        .unwrap_or(id)
+fn name_of<'a>(id: &'a str, names: &HashMap<&str, &'a str>) -> &'a str {
+    names.get(id).copied().unwrap_or(id)
 }
 
 /// Convert a C4 model to a compact text representation for LLM consumption.
 pub fn serialize_diagram(model: &C4ModelData) -> String {
-    let mut out = String::with_capacity(2048);
+    // Roughly one short line per node and edge; avoids regrowing on large models.
+    let mut out = String::with_capacity(64 + (model.nodes.len() + model.edges.len()) * 96);
+    let names: HashMap<&str, &str> = model
+        .nodes
+        .iter()
+        .map(|n| (n.id.as_str(), n.data.name.as_str()))
+        .collect();
 
     out.push_str("NODES:\n");
     for node in &model.nodes {
@@ -39,7 +43,7 @@ pub fn serialize_diagram(model: &C4ModelData) -> String {
         }
         if let Some(pid) = &node.parent_id {
             out.push_str(",parent=");
-            out.push_str(name_of(pid, model));
+            out.push_str(name_of(pid, &names));
         }
         out.push(')');
         if let Some(tech) = &d.technology {
@@ -82,7 +86,7 @@ pub fn serialize_diagram(model: &C4ModelData) -> String {
 
         out.push_str(&edge.source);
         out.push_str(" \"");
-        out.push_str(name_of(&edge.source, model));
+        out.push_str(name_of(&edge.source, &names));
         out.push_str("\" --[");
         out.push_str(label);
         if let Some(t) = tech {
@@ -92,7 +96,7 @@ pub fn serialize_diagram(model: &C4ModelData) -> String {
         out.push_str("]--> ");
         out.push_str(&edge.target);
         out.push_str(" \"");
-        out.push_str(name_of(&edge.target, model));
+        out.push_str(name_of(&edge.target, &names));
         out.push('"');
         out.push('\n');
     }
@@ -115,16 +119,15 @@ fn serialize_flow(out: &mut String, flow: &Flow) {
 }
 
 fn serialize_steps(out: &mut String, steps: &[scryer_core::FlowStep], indent: usize) {
-    let pad: String = " ".repeat(indent);
     for step in steps {
-        out.push_str(&pad);
+        push_indent(out, indent);
         out.push('[');
         out.push_str(&step.id);
         out.push_str("] ");
         out.push_str(step.description.as_deref().unwrap_or("(empty)"));
         out.push('\n');
         for branch in &step.branches {
-            out.push_str(&pad);
+            push_indent(out, indent);
             out.push_str("  branch");
             if !branch.condition.is_empty() {
                 out.push_str(" \"");
@@ -137,6 +140,10 @@ fn serialize_steps(out: &mut String, steps: &[scryer_core::FlowStep], indent: us
     }
 }
 
+fn push_indent(out: &mut String, indent: usize) {
+    out.extend(std::iter::repeat(' ').take(indent));
+}
+
 fn kind_str(kind: &C4Kind) -> &'static str {
     match kind {
         C4Kind::Person => "person",
@@ -149,7 +156,14 @@ fn kind_str(kind: &C4Kind) -> &'static str {
     }
 }
 
-pub fn system_prompt() -> String {
+/// The system prompt is constant for the process (instructions + C4 rules),
+/// so it is formatted once on first use.
+pub fn system_prompt() -> &'static str {
+    static PROMPT: OnceLock<String> = OnceLock::new();
+    PROMPT.get_or_init(build_system_prompt)
+}
+
+fn build_system_prompt() -> String {
     format!(
         "You are a C4 architecture modeling advisor. Review diagrams for architectural quality — \
 naming, relationships, structural problems.\n\n\
@@ -1,6 +1,6 @@
 use std::collections::HashSet;
 use std::path::PathBuf;
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, OnceLock};
 
 use notify::{recommended_watcher, EventKind, RecursiveMode, Watcher};
 use tauri::{Emitter, Manager, path::BaseDirectory};
@@ -44,7 +44,8 @@ fn ensure_full_path() {
 struct SettingsState(Arc<Mutex<scryer_core::AiSettings>>);
 
 /// Managed state for the ACP runtime (agent orchestration).
-struct AcpState(Mutex<Option<scryer_acp::AcpRuntime>>);
+/// Created lazily on the first session and reused for the app's lifetime.
+struct AcpState(OnceLock<scryer_acp::AcpRuntime>);
 
 /// Pre-sync model snapshot for diffing after agent completes.
 struct SyncSnapshot(Mutex<Option<scryer_core::C4ModelData>>);
@@ -58,8 +59,11 @@ struct WatcherState {
 
 
 #[tauri::command]
-fn list_models() -> Result<serde_json::Value, String> {
-    let entries = scryer_core::list_all_models()?;
+async fn list_models() -> Result<serde_json::Value, String> {
+    // Reads every global model plus each registered project's .scryer/ dir.
+    let entries = tauri::async_runtime::spawn_blocking(scryer_core::list_all_models)
+        .await
+        .map_err(|e| e.to_string())??;
     serde_json::to_value(entries).map_err(|e| e.to_string())
 }
 
@@ -134,14 +138,13 @@ fn watch_project(
 fn try_migrate_model(name: String) -> Result<String, String> {
     let model_ref = scryer_core::ModelRef::parse(&name);
     if let scryer_core::ModelRef::Global(ref global_name) = model_ref {
-        if let Ok(model) = scryer_core::read_model_at(&model_ref) {
-            if let Some(ref pp) = model.project_path {
-                let project = std::path::Path::new(pp);
-                if project.exists() && project.is_dir() {
-                    match scryer_core::migrate_to_local(global_name) {
-                        Ok(new_ref) => return Ok(new_ref.to_ref_string()),
-                        Err(_) => {} // migration failed, continue with global
-                    }
+        // Only the project path matters here — don't parse the whole model
+        if let Some(pp) = scryer_core::read_model_project_path(global_name) {
+            let project = std::path::Path::new(&pp);
+            if project.exists() && project.is_dir() {
+                match scryer_core::migrate_to_local(global_name) {
+                    Ok(new_ref) => return Ok(new_ref.to_ref_string()),
+                    Err(_) => {} // migration failed, continue with global
                 }
             }
         }
@@ -185,7 +188,16 @@ fn read_model(name: String) -> Result<String, String> {
     let model_ref = scryer_core::ModelRef::parse(&name);
     let raw = scryer_core::read_model_raw_at(&model_ref)?;
     // Migrate old kind values ("function", "unit", "member") → "operation"
-    // and ensure operation nodes have type "operation" (was "c4")
+    // and ensure operation nodes have type "operation" (was "c4").
+    // Files that mention none of these kinds can't need it — skip building a Value,
+    // but still reject malformed JSON so callers see the same error as before.
+    if !["\"function\"", "\"unit\"", "\"member\"", "\"operation\""]
+        .iter()
+        .any(|k| raw.contains(k))
+    {
+        serde_json::from_str::<serde::de::IgnoredAny>(&raw).map_err(|e| e.to_string())?;
+        return Ok(raw);
+    }
     let mut val: serde_json::Value = serde_json::from_str(&raw).map_err(|e| e.to_string())?;
     let mut migrated = false;
     if let Some(nodes) = val.get_mut("nodes").and_then(|n| n.as_array_mut()) {
@@ -496,6 +508,17 @@ fn detect_ai_tools(project_path: Option<String>) -> serde_json::Value {
 
 /// Find the scryer-mcp binary path by checking common locations.
 fn find_scryer_mcp() -> Option<String> {
+    // The install location doesn't change while the app runs; remember it once found.
+    // A miss isn't cached so installing scryer-mcp later is still picked up.
+    static PATH: OnceLock<String> = OnceLock::new();
+    if let Some(path) = PATH.get() {
+        return Some(path.clone());
+    }
+    let found = locate_scryer_mcp()?;
+    Some(PATH.get_or_init(|| found).clone())
+}
+
+fn locate_scryer_mcp() -> Option<String> {
     // Check next to scryer (same install dir)
     if let Ok(exe) = std::env::current_exe() {
         let sibling = exe.parent().map(|p| p.join("scryer-mcp"));
@@ -649,8 +672,15 @@ fn write_sync_marker(path: &std::path::Path, time: std::time::SystemTime) -> Res
 }
 
 #[tauri::command]
-fn check_drift(model_name: String) -> Result<serde_json::Value, String> {
-    let model_ref = scryer_core::ModelRef::parse(&model_name);
+async fn check_drift(model_name: String) -> Result<serde_json::Value, String> {
+    // Drift walks the whole project tree; keep it off the IPC/main thread.
+    tauri::async_runtime::spawn_blocking(move || check_drift_blocking(&model_name))
+        .await
+        .map_err(|e| e.to_string())?
+}
+
+fn check_drift_blocking(model_name: &str) -> Result<serde_json::Value, String> {
+    let model_ref = scryer_core::ModelRef::parse(model_name);
     // If an agent is actively implementing, suppress drift detection
     let implementing = scryer_core::is_implementing_at(&model_ref);
 
@@ -660,20 +690,27 @@ fn check_drift(model_name: String) -> Result<serde_json::Value, String> {
 
     let baseline = drift_baseline(&model_ref)?;
 
+    // The report would be discarded anyway — don't walk the project for it
+    if implementing {
+        return Ok(serde_json::json!({
+            "nodes": [],
+            "structureChanged": false,
+            "implementing": true,
+        }));
+    }
+
     let report = scryer_core::drift::check_drift(&model, baseline, std::path::Path::new(project_path));
 
     Ok(serde_json::json!({
-        "nodes": if implementing { vec![] } else {
-            report.nodes.iter().map(|d| {
-                serde_json::json!({
-                    "nodeId": d.node_id,
-                    "nodeName": d.node_name,
-                    "patterns": d.patterns,
-                })
-            }).collect::<Vec<_>>()
-        },
-        "structureChanged": if implementing { false } else { report.structure_changed },
-        "implementing": implementing,
+        "nodes": report.nodes.iter().map(|d| {
+            serde_json::json!({
+                "nodeId": d.node_id,
+                "nodeName": d.node_name,
+                "patterns": d.patterns,
+            })
+        }).collect::<Vec<_>>(),
+        "structureChanged": report.structure_changed,
+        "implementing": false,
     }))
 }
 
@@ -717,16 +754,22 @@ async fn start_agent_session(
     let mcp_binary = find_scryer_mcp()
         .ok_or("scryer-mcp binary not found — cannot provide MCP server to agent")?;
 
-    // Compute drifted nodes to pass to the agent
+    // Compute drifted nodes to pass to the agent. Reading the model and walking
+    // the project tree is blocking I/O, so it runs off the async runtime.
     let model_ref = scryer_core::ModelRef::parse(&model_name);
-    let model = scryer_core::read_model_at(&model_ref)?;
+    let (model, report) = tauri::async_runtime::spawn_blocking(move || -> Result<_, String> {
+        let model = scryer_core::read_model_at(&model_ref)?;
+        let project_path = model.project_path.as_deref()
+            .ok_or("Model has no project path set")?;
+        let baseline = drift_baseline(&model_ref)?;
+        let report = scryer_core::drift::check_drift(&model, baseline, std::path::Path::new(project_path));
+        Ok((model, report))
+    })
+    .await
+    .map_err(|e| e.to_string())??;
 
     // Snapshot the model before sync so we can diff after completion
     *snapshot_state.0.lock().unwrap() = Some(model.clone());
-    let project_path = model.project_path.as_deref()
-        .ok_or("Model has no project path set")?;
-    let baseline = drift_baseline(&model_ref)?;
-    let report = scryer_core::drift::check_drift(&model, baseline, std::path::Path::new(project_path));
     let drifted = report.nodes;
 
     // Pre-serialize model and build the sync prompt
@@ -739,14 +782,8 @@ async fn start_agent_session(
     let launch = scryer_acp::resolve_agent_binary(&client.name)
         .ok_or_else(|| format!("Agent '{}' not found on PATH", client.name))?;
 
-    // Ensure runtime exists and clone it out of the mutex
-    let runtime = {
-        let mut rt = state.0.lock().unwrap();
-        if rt.is_none() {
-            *rt = Some(scryer_acp::AcpRuntime::new());
-        }
-        rt.clone().unwrap()
-    };
+    // Started once on first use, then shared by every session
+    let runtime = state.0.get_or_init(scryer_acp::AcpRuntime::new);
 
     let (event_tx, mut event_rx) = tokio::sync::mpsc::unbounded_channel();
 
@@ -816,13 +853,7 @@ async fn start_initial_model_session(
 
     let prompt = scryer_acp::prompt::initial_model_prompt(&model_name, &cwd);
 
-    let runtime = {
-        let mut rt = state.0.lock().unwrap();
-        if rt.is_none() {
-            *rt = Some(scryer_acp::AcpRuntime::new());
-        }
-        rt.clone().unwrap()
-    };
+    let runtime = state.0.get_or_init(scryer_acp::AcpRuntime::new);
 
     let (event_tx, mut event_rx) = tokio::sync::mpsc::unbounded_channel();
 
@@ -862,7 +893,9 @@ async fn start_node_fill_session(
         .ok_or("No AI agent found. Install Claude Code or Codex first.")?;
 
     let model_ref = scryer_core::ModelRef::parse(&model_name);
-    let model = scryer_core::read_model_at(&model_ref)?;
+    let model = tauri::async_runtime::spawn_blocking(move || scryer_core::read_model_at(&model_ref))
+        .await
+        .map_err(|e| e.to_string())??;
     let node = model.nodes.iter().find(|n| n.id == node_id)
         .ok_or_else(|| format!("Node '{}' not found in model", node_id))?;
     let node_name = node.data.name.clone();
@@ -876,13 +909,7 @@ async fn start_node_fill_session(
         &model_name, &cwd, &node_id, &node_name, &node_kind, &model_json,
     );
 
-    let runtime = {
-        let mut rt = state.0.lock().unwrap();
-        if rt.is_none() {
-            *rt = Some(scryer_acp::AcpRuntime::new());
-        }
-        rt.clone().unwrap()
-    };
+    let runtime = state.0.get_or_init(scryer_acp::AcpRuntime::new);
 
     let (event_tx, mut event_rx) = tokio::sync::mpsc::unbounded_channel();
 
@@ -913,10 +940,7 @@ async fn cancel_agent_session(
     state: tauri::State<'_, AcpState>,
     snapshot_state: tauri::State<'_, SyncSnapshot>,
 ) -> Result<(), String> {
-    let runtime = {
-        let rt = state.0.lock().unwrap();
-        rt.clone().ok_or("ACP runtime not initialized")?
-    };
+    let runtime = state.0.get().ok_or("ACP runtime not initialized")?;
     runtime.cancel().await?;
 
     // Restore the model to its pre-sync state
@@ -1005,7 +1029,7 @@ pub fn run() {
         .plugin(tauri_plugin_opener::init())
         .plugin(tauri_plugin_dialog::init())
         .manage(SettingsState(settings_state))
-        .manage(AcpState(Mutex::new(None)))
+        .manage(AcpState(OnceLock::new()))
         .manage(SyncSnapshot(Mutex::new(None)))
         .setup(move |app| {
             let handle = app.handle().clone();